@@ -1,7 +1,11 @@
 # cobb_douglas_app.py
+import hashlib
+import inspect
+
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
+import plotly.io as pio
 
 # st.title("Cobb–Douglas Utility Function: Indifference Curves")
 st.markdown(r"Utility function: $U(x, y) = x^{\alpha} y^{\beta}$")
@@ -48,54 +52,124 @@ if update:
 alpha = st.session_state.alpha
 beta = st.session_state.beta
 
-# Compute utility surface
-x = np.linspace(0.1, 10, 300)
-y = np.linspace(0.1, 10, 300)
-X, Y = np.meshgrid(x, y)
-U = (X ** alpha) * (Y ** beta)
-
 # Reference points
 x_ref = 5
 y_refs = np.array([1, 2, 3, 4, 5, 6, 7])
-U_levels = (x_ref ** alpha) * (y_refs ** beta)
-
-# Create figure
-fig = go.Figure()
-
-# Add one contour line for each utility level
-for U_level in U_levels:
-    fig.add_trace(go.Contour(
-        x=x,
-        y=y,
-        z=U,
-        contours=dict(
-            start=U_level,
-            end=U_level,
-            size=1e-6,
-            coloring='none'
-        ),
-        line=dict(width=2),
-        showscale=False,
+
+
+# Static figure layout, shared by every (α, β); built once, not on every rerun
+@st.cache_resource
+def _layout() -> go.Layout:
+    return go.Layout(
+        xaxis_title="Good X",
+        yaxis_title="Good Y",
+        xaxis_range=[0.1, 10],
+        yaxis_range=[0.1, 10],
+        width=750,
+        height=600,
+        showlegend=False
+    )
+
+
+# --- Cached computations (keyed on α, β; reused across reruns) ---
+@st.cache_data(max_entries=32)
+def compute_indifference_curves(alpha: float, beta: float):
+    # Closed form of x^α y^β = U: y = U^(1/β) · x^(-α/β), one row per level.
+    # Separable in (U, x), so the whole (levels × xs) block is an outer product.
+    # float32 is ample for plotting and halves memory traffic / payload size
+    xs = np.linspace(0.1, 10, 400, dtype=np.float32)
+    xs_pow = np.power(xs, np.float32(-alpha / beta))
+    levels_pow = np.power(compute_levels(alpha, beta), np.float32(1.0 / beta))
+    curves = np.multiply.outer(levels_pow, xs_pow)
+    return xs, curves
+
+
+@st.cache_data(max_entries=32)
+def compute_levels(alpha: float, beta: float):
+    xa = np.float32(float(x_ref) ** float(alpha))
+    return xa * np.power(y_refs.astype(np.float32), np.float32(beta))
+
+
+# Kept on purpose: off-grid (α, β) bypass the disk cache below and are served from here
+@st.cache_resource(max_entries=16)
+def build_figure(alpha: float, beta: float) -> go.Figure:
+    # Compute indifference curves
+    U_levels = compute_levels(alpha, beta)
+    xs, curves = compute_indifference_curves(alpha, beta)
+
+    # Create figure
+    fig = go.Figure(layout=_layout())
+    # fig.update_layout(title=f"Indifference Curves through (5,1)…(5,7)  —  α={alpha:.2f}, β={beta:.2f}")
+
+    # Add all utility levels as a single line trace, curves separated by NaN gaps
+    n_levels = curves.shape[0]
+    gap = np.full((n_levels, 1), np.nan, dtype=curves.dtype)
+    fig.add_trace(go.Scatter(
+        x=np.hstack([np.broadcast_to(xs, curves.shape), gap]).ravel(),
+        y=np.hstack([curves, gap]).ravel(),
+        mode="lines",
+        line=dict(width=2, color="black"),
+        hoverinfo="skip",
     ))
 
-    # Add labelled points (5,1)…(5,7)
-for y_val, u_val in zip(y_refs, U_levels):
+    # Add labelled points (5,1)…(5,7) as a single trace
+    texts = [f"(5,{int(y_val)}): U={u_val:.2f}" for y_val, u_val in zip(y_refs, U_levels)]
     fig.add_trace(go.Scatter(
-        x=[x_ref],
-        y=[y_val],
+        x=np.full_like(y_refs, x_ref),
+        y=y_refs,
         mode="markers+text",
-        text=[f"(5,{int(y_val)}): U={u_val:.2f}"],
+        text=texts,
         textposition="middle right",
         marker=dict(color="red", size=8)
     ))
 
-fig.update_layout(
-    xaxis_title="Good X",
-    yaxis_title="Good Y",
-    # title=f"Indifference Curves through (5,1)…(5,7)  —  α={alpha:.2f}, β={beta:.2f}",
-    width=750,
-    height=600,
-    showlegend=False
-)
+    return fig
+
+
+def figure_version() -> str:
+    # The disk cache below is keyed only on its own arguments and source, not on
+    # the figure code it calls; hashing that code makes any edit to it a new key
+    source = "".join(
+        inspect.getsource(getattr(f, "__wrapped__", f))
+        for f in (build_figure, _layout, compute_indifference_curves, compute_levels)
+    )
+    return hashlib.sha256(source.encode()).hexdigest()[:16]
+
+
+@st.cache_data(persist="disk", max_entries=400)
+def precomputed_figure_json(alpha_rounded: float, beta_rounded: float, version: str) -> str:
+    # Serialized figure survives server restarts; later lookups skip NumPy/Plotly construction.
+    # Only called for the 0.1-step grid, so at most 20 × 20 files per version on disk
+    return build_figure(alpha_rounded, beta_rounded).to_json()
+
+
+@st.cache_data(persist="disk")
+def _stored_figure_version() -> str:
+    # Version of the figure code the disk cache was filled with, persisted next to
+    # it so a restart after an edit can tell the old entries are stale
+    return figure_version()
+
+
+def on_step_grid(value: float) -> bool:
+    return abs(value * 10 - round(value * 10)) < 1e-9
+
+
+# Round to the displayed input precision so equivalent inputs share one cache entry
+params = (round(alpha, 2), round(beta, 2))
+
+# Rebuild only when (α, β) changed; other reruns reuse the stored figure
+if st.session_state.get("last_params") != params:
+    if all(on_step_grid(v) for v in params):
+        version = figure_version()
+        if _stored_figure_version() != version:
+            # Figure code changed since the disk cache was filled: drop its files
+            precomputed_figure_json.clear()
+            _stored_figure_version.clear()
+            _stored_figure_version()
+        st.session_state.fig = pio.from_json(precomputed_figure_json(*params, version))
+    else:
+        # Off-grid values are not persisted to disk; build_figure's in-memory cache serves them
+        st.session_state.fig = build_figure(*params)
+    st.session_state.last_params = params
 
-st.plotly_chart(fig)
\ No newline at end of file
+st.plotly_chart(st.session_state.fig)
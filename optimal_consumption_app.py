@@ -1,6 +1,6 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
+import plotly.graph_objects as go
 
 st.set_page_config(page_title="Optimal Consumption Tool", layout="centered")
 
@@ -44,19 +44,22 @@ compute = st.sidebar.button("Compute optimum")
 # -------------------------------------------------------------
 # Helper solvers
 # -------------------------------------------------------------
+@st.cache_data(max_entries=256)
 def cobb_douglas_opt(px, py, M, α, β):
     x = α / (α + β) * M / px
     y = β / (α + β) * M / py
     U = (x ** α) * (y ** β)
     return x, y, U
 
+@st.cache_data(max_entries=256)
 def leontief_opt(px, py, M, α, β):
     k = α / β
     x = M / (px + py * k)
     y = k * x
-    U = min(α * x, β * y)
+    U = α * x  # β * y == α * x at the kink, since y = (α/β) * x
     return x, y, U
 
+@st.cache_data(max_entries=256)
 def linear_opt(px, py, M, α, β):
     slope_IC = α / β
     slope_BL = px / py
@@ -83,51 +86,69 @@ def linear_opt(px, py, M, α, β):
 # -------------------------------------------------------------
 # Plotting function (keeps plotting logic in one place)
 # -------------------------------------------------------------
+def _cobb_ic(xs, alpha, beta, U):
+    # (U / x^α)^(1/β) evaluated in log space: U^(1/β) alone overflows a float
+    # for small β, while the log of the result stays bounded by log(y_max).
+    # Plain NumPy rather than a Numba kernel: the curve has only 150 points,
+    # so JIT compilation would cost more than it saves.
+    return np.exp((np.log(U) - alpha * np.log(xs)) / beta)
+
 def plot_budget_and_ic(M, px, py, utility_type, alpha, beta, x_star, y_star, U_star, status_flag):
     x_max = M / px
     y_max = M / py
 
-    fig, ax = plt.subplots(figsize=(6, 6))
+    fig = go.Figure()
+
+    # Budget line (a straight line: its two intercepts are enough)
+    x_vals = np.array([0.0, x_max])
+    budget_y = np.array([y_max, 0.0])
+    fig.add_trace(go.Scatter(x=x_vals, y=budget_y, mode="lines",
+                             line=dict(color="black"), name="Budget line"))
 
-    # Budget line
-    x_vals = np.linspace(0, x_max, 400)
-    budget_y = (M - px * x_vals) / py
-    ax.plot(x_vals, budget_y, color="black", label="Budget line")
+    ic_line = dict(color="green", width=2)
+    ic_name = f"IC (U={U_star:.2f})"
 
     # Indifference curve depending on utility_type
     if utility_type.startswith("Linear"):
         # For "many" we still draw the representative indifference curve across budget line
-        y_ic = (U_star - alpha * x_vals) / beta
-        mask = (y_ic >= 0) & (y_ic <= y_max)
-        ax.plot(x_vals[mask], y_ic[mask], color="green", linewidth=2, label=f"IC (U={U_star:.2f})")
+        # The IC lies in [0, y_max] for x in [(U - β·y_max)/α, U/α]; clip that to [0, x_max]
+        x_lo = max(0.0, (U_star - beta * y_max) / alpha)
+        x_hi = min(x_max, U_star / alpha)
+        ic_x_vals = np.array([x_lo, x_hi])
+        y_ic = (U_star - alpha * ic_x_vals) / beta
+        fig.add_trace(go.Scatter(x=ic_x_vals, y=y_ic, mode="lines", line=ic_line, name=ic_name))
 
     elif utility_type.startswith("Leontief"):
         x_corner = U_star / alpha
         y_corner = U_star / beta
-        # horizontal to the right
-        ax.plot([x_corner, x_max], [y_corner, y_corner], color="green", linewidth=2, label=f"IC (U={U_star:.2f})")
-        # vertical upward
-        ax.plot([x_corner, x_corner], [y_corner, y_max], color="green", linewidth=2)
+        # vertical down to the corner, then horizontal to the right
+        fig.add_trace(go.Scatter(x=[x_corner, x_corner, x_max], y=[y_max, y_corner, y_corner],
+                                 mode="lines", line=ic_line, name=ic_name))
 
     else:  # Cobb–Douglas
-        xs = np.linspace(max(1e-6, x_max * 0.01), x_max, 400)
-        ys = (U_star / (xs ** alpha)) ** (1 / beta)
-        mask = (ys >= 0) & (ys <= y_max)
-        ax.plot(xs[mask], ys[mask], color="green", linewidth=2, label=f"IC (U={U_star:.2f})")
+        # The IC reaches y_max at x = (U / y_max^β)^(1/α) and stays below it to the right
+        x_min = (U_star / y_max ** beta) ** (1 / alpha)
+        # log-spaced: the curve bends sharply near x → 0 and flattens out for large x
+        xs = np.logspace(np.log10(max(x_min, x_max * 0.01)), np.log10(x_max), 150)
+        ys = _cobb_ic(xs, alpha, beta, U_star)
+        fig.add_trace(go.Scatter(x=xs, y=ys, mode="lines", line=ic_line, name=ic_name))
 
     # Optimal point: only if it is a single point (not the "many" case)
     if status_flag != "many":
-        ax.scatter([x_star], [y_star], color="red", zorder=5, label="Optimal bundle")
-        ax.text(x_star, y_star, f"  ({x_star:.2f}, {y_star:.2f})", verticalalignment="bottom", fontsize=9)
-
-    ax.set_xlim(0, x_max * 1.05)
-    ax.set_ylim(0, y_max * 1.05)
-    ax.set_xlabel("Quantity of x")
-    ax.set_ylabel("Quantity of y")
-    ax.grid(alpha=0.3)
-    ax.legend()
-
-    st.pyplot(fig)
+        fig.add_trace(go.Scatter(x=[x_star], y=[y_star], mode="markers+text",
+                                 marker=dict(color="red", size=9),
+                                 text=[f"  ({x_star:.2f}, {y_star:.2f})"],
+                                 textposition="top right", textfont=dict(size=11),
+                                 name="Optimal bundle"))
+
+    fig.update_layout(
+        xaxis=dict(title="Quantity of x", range=[0, x_max * 1.05]),
+        yaxis=dict(title="Quantity of y", range=[0, y_max * 1.05]),
+        height=600,
+        showlegend=True,
+    )
+
+    st.plotly_chart(fig, width="stretch")
 
 
 # -------------------------------------------------------------